@@ -1,14 +1,216 @@
 """CLI for downloading Azure Pipeline logs from conda-forge PRs."""
 
+import hashlib
 import json
+import os
 import re
+import shutil
 import sys
-import urllib.error
-import urllib.request
+import tempfile
+import threading
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 import click
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+
+    _json_loads: Callable[[bytes], Any] = orjson.loads
+except ImportError:  # pragma: no cover
+    _json_loads = json.loads
+
+GITHUB_API_HEADERS = {"Accept": "application/vnd.github.v3+json"}
+
+_PR_URL_RE = re.compile(r"https://github\.com/([^/]+)/([^/]+)/pull/(\d+)")
+_AZ_ORG_PROJ_RE = re.compile(r"https://dev\.azure\.com/([^/]+)/([^/]+)/_build")
+_AZ_BUILD_ID_RE = re.compile(r"buildId=(\d+)")
+_AZ_JOB_ID_RE = re.compile(r"jobId=([0-9a-f-]+)")
+_NAME_TOKEN_SEP_RE = re.compile(r"[^a-z0-9]+")
+
+# Upper bound on concurrent log segment downloads per build
+MAX_PARALLEL_DOWNLOADS = 16
+
+# Upper bound on PRs processed at the same time, to stay clear of GitHub's
+# secondary rate limits
+MAX_PARALLEL_PRS = 8
+
+# Size of the HTTP connection pool per host, also used to cap the number of
+# concurrent requests to dev.azure.com across all builds and PRs
+MAX_CONNECTIONS_PER_HOST = 32
+
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+INPUT_YML_TEMPLATE = """\
+source: {pr_url}
+input: error.log
+most_minimal_output: |
+  # TODO: Fill in the minimal error message
+expected_output: |
+  # TODO: Fill in the expected parsed output
+"""
+
+# GitHub tokens with fewer remaining requests than this are skipped
+MIN_RATE_LIMIT_REMAINING = 10
+
+
+def _create_session() -> requests.Session:
+    """Create an HTTP session that keeps connections alive between requests.
+
+    All requests to api.github.com and dev.azure.com go through this session so
+    that the TCP/TLS handshake is only paid once per host instead of once per
+    request. Transient gateway errors are retried with a short backoff.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=MAX_CONNECTIONS_PER_HOST,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[502, 503, 504],
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+_SESSION = _create_session()
+_AZURE_REQUEST_SLOTS = threading.BoundedSemaphore(MAX_CONNECTIONS_PER_HOST)
+
+
+class GitHubTokenPool:
+    """Round-robin pool of GitHub API tokens.
+
+    Tokens whose last response reported fewer than MIN_RATE_LIMIT_REMAINING
+    remaining requests are skipped until all tokens are in that state.
+    """
+
+    def __init__(self, tokens: list[str]) -> None:
+        self._tokens = tokens
+        self._remaining: dict[str, int] = {}
+        self._next = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "GitHubTokenPool":
+        """Create a pool from the GITHUB_TOKENS or GITHUB_TOKEN variables.
+
+        GITHUB_TOKENS may hold a comma-separated list of tokens.
+        """
+        raw = os.environ.get("GITHUB_TOKENS") or os.environ.get("GITHUB_TOKEN", "")
+        return cls([token.strip() for token in raw.split(",") if token.strip()])
+
+    def get(self) -> str | None:
+        """Get the next token to use.
+
+        Returns:
+            A token, or None if the pool is empty
+        """
+        if not self._tokens:
+            return None
+        with self._lock:
+            for _ in range(len(self._tokens)):
+                token = self._tokens[self._next]
+                self._next = (self._next + 1) % len(self._tokens)
+                remaining = self._remaining.get(token)
+                if remaining is None or remaining >= MIN_RATE_LIMIT_REMAINING:
+                    return token
+            # All tokens are nearly exhausted, use the one with most requests left
+            return max(self._tokens, key=lambda token: self._remaining[token])
+
+    def update(self, token: str, headers: Mapping[str, str]) -> None:
+        """Record the rate limit reported in a response made with a token.
+
+        Args:
+            token: Token used for the request
+            headers: Response headers
+        """
+        remaining = headers.get("X-RateLimit-Remaining")
+        if remaining is None or not remaining.isdigit():
+            return
+        with self._lock:
+            self._remaining[token] = int(remaining)
+
+
+_TOKEN_POOL = GitHubTokenPool.from_env()
+
+
+def get_cache_dir() -> Path:
+    """Get the directory in which GitHub API responses are cached.
+
+    Returns:
+        Cache directory, honoring XDG_CACHE_HOME if set
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "cf-error-corpus"
+
+
+def get_github_api_json(url: str) -> Any:
+    """Get a JSON document from the GitHub API using conditional requests.
+
+    Responses are cached on disk together with their ETag/Last-Modified
+    headers. On subsequent calls these are sent back to GitHub, which answers
+    with 304 Not Modified if nothing changed. Such responses are served from
+    the cache. GitHub only exempts them from the rate limit for authenticated
+    requests.
+
+    Args:
+        url: GitHub API URL
+
+    Returns:
+        Decoded JSON response
+
+    Raises:
+        requests.HTTPError: If API request fails
+    """
+    cache_path = get_cache_dir() / f"{hashlib.sha256(url.encode()).hexdigest()}.json"
+    try:
+        cached = _json_loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        cached = None
+
+    headers = dict(GITHUB_API_HEADERS)
+    if cached is not None:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    token = _TOKEN_POOL.get()
+    if token is not None:
+        headers["Authorization"] = f"Bearer {token}"
+
+    response = _SESSION.get(url, headers=headers, timeout=30)
+    if token is not None:
+        _TOKEN_POOL.update(token, response.headers)
+    if response.status_code == 304 and cached is not None:
+        return cached["body"]
+    response.raise_for_status()
+    body = _json_loads(response.content)
+
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if etag or last_modified:
+        entry = {"etag": etag, "last_modified": last_modified, "body": body}
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first so readers never see partial data
+            with tempfile.NamedTemporaryFile(
+                "w", dir=cache_path.parent, suffix=".tmp", delete=False
+            ) as f:
+                json.dump(entry, f)
+            os.replace(f.name, cache_path)
+        except OSError:
+            pass
+
+    return body
 
 
 def parse_github_pr_url(url: str) -> tuple[str, str, int]:
@@ -23,7 +225,7 @@ def parse_github_pr_url(url: str) -> tuple[str, str, int]:
     Raises:
         ValueError: If URL format is invalid
     """
-    match = re.match(r"https://github\.com/([^/]+)/([^/]+)/pull/(\d+)", url)
+    match = _PR_URL_RE.match(url)
     if not match:
         raise ValueError(
             f"Invalid GitHub PR URL: {url}. "
@@ -45,14 +247,10 @@ def get_pr_info_from_api(owner: str, repo: str, pr_number: int) -> dict[str, Any
         PR information dictionary
 
     Raises:
-        urllib.error.HTTPError: If API request fails
+        requests.HTTPError: If API request fails
     """
     url = f"https://api.github.com/repos/{owner}/{repo}/pulls/{pr_number}"
-    req = urllib.request.Request(url)
-    req.add_header("Accept", "application/vnd.github.v3+json")
-
-    with urllib.request.urlopen(req, timeout=30) as response:
-        return json.loads(response.read().decode())
+    return get_github_api_json(url)
 
 
 def get_commit_check_runs_from_api(
@@ -69,15 +267,10 @@ def get_commit_check_runs_from_api(
         List of check run dictionaries
 
     Raises:
-        urllib.error.HTTPError: If API request fails
+        requests.HTTPError: If API request fails
     """
     url = f"https://api.github.com/repos/{owner}/{repo}/commits/{sha}/check-runs"
-    req = urllib.request.Request(url)
-    req.add_header("Accept", "application/vnd.github.v3+json")
-
-    with urllib.request.urlopen(req, timeout=30) as response:
-        data = json.loads(response.read().decode())
-        return data.get("check_runs", [])
+    return get_github_api_json(url).get("check_runs", [])
 
 
 def download_content(url: str, timeout: int = 30) -> str:
@@ -91,11 +284,65 @@ def download_content(url: str, timeout: int = 30) -> str:
         Content as string
 
     Raises:
-        urllib.error.HTTPError: If download fails
+        requests.HTTPError: If download fails
+    """
+    response = _SESSION.get(url, timeout=timeout)
+    response.raise_for_status()
+    return response.content.decode("utf-8", errors="replace")
+
+
+def download_to_file(url: str, dest: Path, timeout: int = 30) -> int:
+    """Download content from a URL straight into a file.
+
+    The response is streamed in chunks, so the content is never held in
+    memory as a whole and is written without decoding it.
+
+    Args:
+        url: URL to download from
+        dest: File to write the content to
+        timeout: Request timeout in seconds
+
+    Returns:
+        Number of bytes written
+
+    Raises:
+        requests.HTTPError: If download fails
+    """
+    written = 0
+    with _SESSION.get(url, timeout=timeout, stream=True) as response:
+        response.raise_for_status()
+        with open(dest, "wb") as f:
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
+                written += len(chunk)
+    return written
+
+
+def _try_download_to_file(url: str, dest: Path) -> int | None:
+    """Download content from a URL into a file, returning None on failure."""
+    try:
+        with _AZURE_REQUEST_SLOTS:
+            return download_to_file(url, dest)
+    except Exception:
+        return None
+
+
+def get_corpus_entry_dir(
+    output_dir: Path, feedstock_name: str, pr_number: int, build_name: str
+) -> Path:
+    """Get the directory of a corpus entry.
+
+    Args:
+        output_dir: Base output directory for corpus entries
+        feedstock_name: Name of the feedstock (without -feedstock suffix)
+        pr_number: PR number
+        build_name: Build name (e.g., linux_64, osx_64)
+
+    Returns:
+        Path to the entry directory
     """
-    req = urllib.request.Request(url)
-    with urllib.request.urlopen(req, timeout=timeout) as response:
-        return response.read().decode("utf-8", errors="replace")
+    # Create folder name: feedstock-pr-buildname
+    return output_dir / f"{feedstock_name}-{pr_number}-{build_name}"
 
 
 def create_corpus_entry(
@@ -103,7 +350,7 @@ def create_corpus_entry(
     feedstock_name: str,
     pr_number: int,
     build_name: str,
-    log_content: str,
+    log_content: str | None,
     pr_url: str,
 ) -> Path:
     """Create a corpus entry with error.log and input.yml.
@@ -113,31 +360,23 @@ def create_corpus_entry(
         feedstock_name: Name of the feedstock (without -feedstock suffix)
         pr_number: PR number
         build_name: Build name (e.g., linux_64, osx_64)
-        log_content: Full log content
+        log_content: Full log content, or None if error.log was already written
         pr_url: GitHub PR URL for the source field
 
     Returns:
         Path to created directory
     """
-    # Create folder name: feedstock-pr-buildname
-    folder_name = f"{feedstock_name}-{pr_number}-{build_name}"
-    entry_dir = output_dir / folder_name
+    entry_dir = get_corpus_entry_dir(output_dir, feedstock_name, pr_number, build_name)
     entry_dir.mkdir(parents=True, exist_ok=True)
 
     # Write error.log
-    error_log_path = entry_dir / "error.log"
-    error_log_path.write_text(log_content, encoding="utf-8")
+    if log_content is not None:
+        error_log_path = entry_dir / "error.log"
+        error_log_path.write_bytes(log_content.encode("utf-8"))
 
     # Create input.yml
     input_yml_path = entry_dir / "input.yml"
-    input_yml_content = f"""source: {pr_url}
-input: error.log
-most_minimal_output: |
-  # TODO: Fill in the minimal error message
-expected_output: |
-  # TODO: Fill in the expected parsed output
-"""
-    input_yml_path.write_text(input_yml_content, encoding="utf-8")
+    input_yml_path.write_bytes(INPUT_YML_TEMPLATE.format(pr_url=pr_url).encode("utf-8"))
 
     return entry_dir
 
@@ -152,14 +391,15 @@ def extract_build_name_from_check_run_name(name: str, arch: str) -> str:
     Returns:
         Build name (e.g., linux_64, osx_arm64)
     """
-    name_lower = name.lower()
+    tokens = set(_NAME_TOKEN_SEP_RE.split(name.lower()))
+    is_arm = "aarch64" in tokens or "arm64" in tokens
 
     if arch == "linux":
-        if "aarch64" in name_lower or "arm64" in name_lower:
+        if is_arm:
             return "linux_aarch64"
         return "linux_64"
     elif arch == "osx":
-        if "arm64" in name_lower or "aarch64" in name_lower:
+        if is_arm:
             return "osx_arm64"
         return "osx_64"
 
@@ -177,32 +417,38 @@ def find_failed_azure_builds(
     Returns:
         Dictionary mapping architecture to check run info
     """
-    failed_builds: dict[str, dict[str, Any]] = {}
+    linux_run: dict[str, Any] | None = None
+    osx_run: dict[str, Any] | None = None
 
     for run in check_runs:
+        # Stop if we found both
+        if linux_run is not None and osx_run is not None:
+            break
+
         # Look for Azure Pipelines check runs that failed
         if run.get("conclusion") != "failure":
             continue
 
-        if run.get("app", {}).get("slug") != "azure-pipelines":
+        app = run.get("app")
+        if app is None or app.get("slug") != "azure-pipelines":
             continue
 
-        name = run.get("name", "")
+        name_lower = run.get("name", "").lower()
 
         # Check for linux builds
-        if "linux" in name.lower() and "linux" not in failed_builds:
-            failed_builds["linux"] = run
+        if linux_run is None and "linux" in name_lower:
+            linux_run = run
+            continue
 
         # Check for osx/macos builds
-        if (
-            "osx" in name.lower() or "macos" in name.lower()
-        ) and "osx" not in failed_builds:
-            failed_builds["osx"] = run
-
-        # Stop if we found both
-        if len(failed_builds) >= 2:
-            break
+        if osx_run is None and ("osx" in name_lower or "macos" in name_lower):
+            osx_run = run
 
+    failed_builds: dict[str, dict[str, Any]] = {}
+    if linux_run is not None:
+        failed_builds["linux"] = linux_run
+    if osx_run is not None:
+        failed_builds["osx"] = osx_run
     return failed_builds
 
 
@@ -219,19 +465,19 @@ def parse_azure_details_url(
         job_id may be None if not present in the URL.
     """
     # Format: https://dev.azure.com/{org}/{project}/_build/results?buildId={buildId}&view=logs&jobId={jobId}
-    match = re.match(r"https://dev\.azure\.com/([^/]+)/([^/]+)/_build", details_url)
+    match = _AZ_ORG_PROJ_RE.match(details_url)
     if not match:
         return None
 
     org, project = match.groups()
 
-    build_match = re.search(r"buildId=(\d+)", details_url)
+    build_match = _AZ_BUILD_ID_RE.search(details_url)
     if not build_match:
         return None
 
     build_id = build_match.group(1)
 
-    job_match = re.search(r"jobId=([0-9a-f-]+)", details_url)
+    job_match = _AZ_JOB_ID_RE.search(details_url)
     job_id = job_match.group(1) if job_match else None
 
     return org, project, build_id, job_id
@@ -255,9 +501,10 @@ def get_job_log_ids(
         f"https://dev.azure.com/{org}/{project}/_apis/build/builds/{build_id}/timeline"
     )
     try:
-        req = urllib.request.Request(timeline_url)
-        with urllib.request.urlopen(req, timeout=30) as response:
-            data = json.loads(response.read().decode())
+        with _AZURE_REQUEST_SLOTS:
+            response = _SESSION.get(timeline_url, timeout=30)
+        response.raise_for_status()
+        data = _json_loads(response.content)
     except Exception:
         return None
 
@@ -273,25 +520,30 @@ def get_job_log_ids(
     return log_ids if log_ids else None
 
 
-def get_azure_build_logs(
+def download_azure_build_logs(
     org: str,
     project: str,
     build_id: str,
+    dest: Path,
     log_ids: list[int] | None = None,
-) -> str | None:
-    """Get build logs from Azure Pipelines.
+) -> int | None:
+    """Download build logs from Azure Pipelines into a file.
 
     If log_ids is provided, only those specific logs are downloaded.
     Otherwise, all logs for the build are downloaded.
 
+    The logs are streamed to disk and concatenated there in log ID order,
+    separated by newlines.
+
     Args:
         org: Azure DevOps organization
         project: Azure DevOps project
         build_id: Build ID
+        dest: File to write the combined logs to
         log_ids: Optional list of specific log IDs to download
 
     Returns:
-        Combined log content, or None if unable to fetch
+        Number of bytes written, or None if unable to fetch
     """
     base_url = (
         f"https://dev.azure.com/{org}/{project}/_apis/build/builds/{build_id}/logs"
@@ -300,180 +552,291 @@ def get_azure_build_logs(
     try:
         if log_ids is None:
             # Fetch full log list from API
-            req = urllib.request.Request(base_url)
-            with urllib.request.urlopen(req, timeout=30) as response:
-                data = json.loads(response.read().decode())
-            log_ids = [log["id"] for log in data.get("value", []) if "id" in log]
+            with _AZURE_REQUEST_SLOTS:
+                response = _SESSION.get(base_url, timeout=30)
+            response.raise_for_status()
+            data = _json_loads(response.content)
+            # Skip empty segments, there is no point in requesting them
+            log_ids = [
+                log["id"]
+                for log in data.get("value", [])
+                if "id" in log and log.get("lineCount") != 0
+            ]
 
         if not log_ids:
             return None
 
-        logs_content = []
-        total = len(log_ids)
-
-        for i, log_id in enumerate(log_ids, 1):
-            log_url = f"{base_url}/{log_id}"
-            click.echo(f"    Downloading log {i}/{total}...")
-            try:
-                log_content = download_content(log_url)
-                logs_content.append(log_content)
-            except Exception:
-                click.echo(f"    Warning: Could not download log {log_id}")
-                continue
+        if len(log_ids) == 1:
+            click.echo("    Downloading 1 log...")
+            written = _try_download_to_file(f"{base_url}/{log_ids[0]}", dest)
+            if written is None:
+                click.echo(f"    Warning: Could not download log {log_ids[0]}")
+            return written
+
+        click.echo(f"    Downloading {len(log_ids)} logs...")
+        with tempfile.TemporaryDirectory(dir=dest.parent) as tmpdir:
+            log_urls = [f"{base_url}/{log_id}" for log_id in log_ids]
+            part_paths = [Path(tmpdir) / f"{log_id}.log" for log_id in log_ids]
+            max_workers = min(MAX_PARALLEL_DOWNLOADS, len(log_urls))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(
+                    executor.map(_try_download_to_file, log_urls, part_paths)
+                )
 
-        if logs_content:
-            return "\n".join(logs_content)
+            parts = []
+            for log_id, part_path, size in zip(
+                log_ids, part_paths, results, strict=True
+            ):
+                if size is None:
+                    click.echo(f"    Warning: Could not download log {log_id}")
+                    continue
+                parts.append(part_path)
+
+            if not parts:
+                return None
+
+            written = 0
+            with open(dest, "wb") as f:
+                for i, part_path in enumerate(parts):
+                    if i > 0:
+                        written += f.write(b"\n")
+                    with open(part_path, "rb") as part:
+                        shutil.copyfileobj(part, f, DOWNLOAD_CHUNK_SIZE)
+                    written += part_path.stat().st_size
+            return written
 
     except Exception:
         return None
 
-    return None
 
+def process_build(
+    arch: str,
+    run_info: dict[str, Any],
+    output_base: Path,
+    feedstock_name: str,
+    pr_number: int,
+    pr_url: str,
+) -> Path | None:
+    """Download the logs of a failed build and create its corpus entry.
 
-@click.command()
-@click.argument("pr_url")
-@click.option(
-    "-o",
-    "--output-dir",
-    type=click.Path(path_type=Path),
-    default=Path("corpus"),
-    help="Output directory for corpus entries (default: corpus)",
-)
-@click.option(
-    "-c",
-    "--category",
-    default="uncategorized",
-    help="Category subdirectory for corpus entries (default: uncategorized)",
-)
-def main(pr_url: str, output_dir: Path, category: str) -> int:
-    """Download Azure Pipeline logs from conda-forge PRs.
+    Output lines are prefixed with the PR and architecture as several builds
+    may be processed at the same time.
 
-    PR_URL: GitHub PR URL (e.g., https://github.com/conda-forge/nomad-feedstock/pull/52)
+    Args:
+        arch: Architecture (linux or osx)
+        run_info: Check run information from GitHub API
+        output_base: Directory in which the corpus entry is created
+        feedstock_name: Name of the feedstock (without -feedstock suffix)
+        pr_number: PR number
+        pr_url: GitHub PR URL for the source field
+
+    Returns:
+        Path to created directory, or None if the check run has no details URL
+    """
+    prefix = f"[{feedstock_name}#{pr_number} {arch}]"
+    click.echo(f"{prefix} Processing {arch} build: {run_info['name']}")
+
+    # Extract build name from check run name
+    build_name = extract_build_name_from_check_run_name(run_info["name"], arch)
+
+    click.echo(f"{prefix}   Build name: {build_name}")
+
+    # Get details URL
+    details_url = run_info.get("details_url", "")
+    if not details_url:
+        click.echo(f"{prefix}   Warning: No details URL found for {arch} build")
+        return None
+
+    click.echo(f"{prefix}   Details URL: {details_url}")
+
+    # Parse Azure details URL
+    parsed = parse_azure_details_url(details_url)
+
+    entry_dir = get_corpus_entry_dir(output_base, feedstock_name, pr_number, build_name)
+    entry_dir.mkdir(parents=True, exist_ok=True)
+
+    log_content: str | None = None
+    if parsed:
+        az_org, az_project, az_build_id, az_job_id = parsed
+
+        # Try to get job-specific log IDs via timeline API
+        log_ids: list[int] | None = None
+        if az_job_id:
+            click.echo(f"{prefix}   Fetching job-specific logs (job {az_job_id})...")
+            log_ids = get_job_log_ids(az_org, az_project, az_build_id, az_job_id)
+            if log_ids:
+                click.echo(f"{prefix}   Found {len(log_ids)} logs for this job")
+            else:
+                click.echo(
+                    f"{prefix}   Warning: Could not get job-specific logs, "
+                    "falling back to all build logs"
+                )
+
+        click.echo(f"{prefix}   Downloading logs from Azure API...")
+        log_size = download_azure_build_logs(
+            az_org, az_project, az_build_id, entry_dir / "error.log", log_ids
+        )
+
+        if log_size:
+            click.echo(f"{prefix}   Successfully downloaded logs ({log_size} bytes)")
+        else:
+            click.echo(f"{prefix}   Warning: Could not download logs from Azure API")
+            log_content = (
+                f"# Could not download logs automatically\n"
+                f"# Azure details URL: {details_url}\n"
+                f"# Please download manually\n"
+            )
+    else:
+        click.echo(f"{prefix}   Warning: Could not parse Azure details URL")
+        log_content = (
+            f"# Could not parse Azure details URL\n"
+            f"# Azure details URL: {details_url}\n"
+            f"# Please download manually\n"
+        )
+
+    # Write input.yml and the error.log placeholder if nothing was downloaded
+    create_corpus_entry(
+        output_base,
+        feedstock_name,
+        pr_number,
+        build_name,
+        log_content,
+        pr_url,
+    )
+    click.echo(f"{prefix}   Created entry directory: {entry_dir}")
+    return entry_dir
+
+
+def process_pr(pr_url: str, output_dir: Path, category: str, debug: bool) -> int:
+    """Create corpus entries for the failed Azure builds of a PR.
+
+    Args:
+        pr_url: GitHub PR URL
+        output_dir: Output directory for corpus entries
+        category: Category subdirectory for corpus entries
+        debug: Whether to print a full traceback on unexpected errors
+
+    Returns:
+        Exit code (0 for success, 1 for errors or no failed builds)
     """
     try:
         # Parse PR URL
         owner, repo, pr_number = parse_github_pr_url(pr_url)
-        click.echo(f"Fetching PR info for {owner}/{repo}#{pr_number}...")
+
+        # Extract feedstock name (remove -feedstock suffix if present)
+        feedstock_name = repo.replace("-feedstock", "")
+        prefix = f"[{feedstock_name}#{pr_number}]"
+        click.echo(f"{prefix} Fetching PR info for {owner}/{repo}#{pr_number}...")
 
         # Get PR info
         pr_info = get_pr_info_from_api(owner, repo, pr_number)
         head_sha = pr_info["head"]["sha"]
-        click.echo(f"Head commit: {head_sha}")
+        click.echo(f"{prefix} Head commit: {head_sha}")
 
         # Get check runs
-        click.echo("Fetching check runs...")
+        click.echo(f"{prefix} Fetching check runs...")
         check_runs = get_commit_check_runs_from_api(owner, repo, head_sha)
 
         # Find failed builds
         failed_builds = find_failed_azure_builds(check_runs)
 
         if not failed_builds:
-            click.echo("No failed Azure Pipeline builds found for this PR.")
+            click.echo(f"{prefix} No failed Azure Pipeline builds found for this PR.")
             return 1
 
         click.echo(
-            f"Found {len(failed_builds)} failed build(s): {', '.join(failed_builds.keys())}"
+            f"{prefix} Found {len(failed_builds)} failed build(s): "
+            f"{', '.join(failed_builds.keys())}"
         )
 
-        # Extract feedstock name (remove -feedstock suffix if present)
-        feedstock_name = repo.replace("-feedstock", "")
-
         # Create output directory
         output_base = output_dir / category
         output_base.mkdir(parents=True, exist_ok=True)
 
-        # Download logs for each failed build
-        for arch, run_info in failed_builds.items():
-            click.echo(f"\nProcessing {arch} build: {run_info['name']}")
-
-            # Extract build name from check run name
-            build_name = extract_build_name_from_check_run_name(run_info["name"], arch)
-
-            click.echo(f"  Build name: {build_name}")
-
-            # Get details URL
-            details_url = run_info.get("details_url", "")
-            if not details_url:
-                click.echo(f"  Warning: No details URL found for {arch} build")
-                continue
-
-            click.echo(f"  Details URL: {details_url}")
-
-            # Parse Azure details URL
-            parsed = parse_azure_details_url(details_url)
-
-            if parsed:
-                az_org, az_project, az_build_id, az_job_id = parsed
-
-                # Try to get job-specific log IDs via timeline API
-                log_ids: list[int] | None = None
-                if az_job_id:
-                    click.echo(f"  Fetching job-specific logs (job {az_job_id})...")
-                    log_ids = get_job_log_ids(
-                        az_org, az_project, az_build_id, az_job_id
-                    )
-                    if log_ids:
-                        click.echo(f"  Found {len(log_ids)} logs for this job")
-                    else:
-                        click.echo(
-                            "  Warning: Could not get job-specific logs, "
-                            "falling back to all build logs"
-                        )
-
-                click.echo("  Downloading logs from Azure API...")
-                log_content = get_azure_build_logs(
-                    az_org, az_project, az_build_id, log_ids
-                )
-
-                if log_content:
-                    click.echo(
-                        f"  Successfully downloaded logs ({len(log_content)} bytes)"
-                    )
-                else:
-                    click.echo("  Warning: Could not download logs from Azure API")
-                    log_content = (
-                        f"# Could not download logs automatically\n"
-                        f"# Azure details URL: {details_url}\n"
-                        f"# Please download manually\n"
-                    )
-            else:
-                click.echo("  Warning: Could not parse Azure details URL")
-                log_content = (
-                    f"# Could not parse Azure details URL\n"
-                    f"# Azure details URL: {details_url}\n"
-                    f"# Please download manually\n"
+        # Download logs for all failed builds concurrently
+        with ThreadPoolExecutor(max_workers=len(failed_builds)) as executor:
+            futures = [
+                executor.submit(
+                    process_build,
+                    arch,
+                    run_info,
+                    output_base,
+                    feedstock_name,
+                    pr_number,
+                    pr_url,
                 )
+                for arch, run_info in failed_builds.items()
+            ]
+            for future in futures:
+                future.result()
 
-            # Create entry directory
-            entry_dir = create_corpus_entry(
-                output_base,
-                feedstock_name,
-                pr_number,
-                build_name,
-                log_content,
-                pr_url,
-            )
-            click.echo(f"  Created entry directory: {entry_dir}")
-
-        click.echo("\nDone!")
         return 0
 
-    except urllib.error.HTTPError as e:
-        click.echo(f"HTTP Error: {e.code} - {e.reason}", err=True)
-        if e.code == 403:
+    except requests.HTTPError as e:
+        click.echo(f"HTTP Error: {e}", err=True)
+        if e.response is not None and e.response.status_code == 403:
             click.echo(
                 "Note: GitHub API rate limit may be exceeded. "
-                "Consider using a GitHub token.",
+                "Consider setting GITHUB_TOKEN.",
                 err=True,
             )
         return 1
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
-        import traceback
+        if debug:
+            import traceback
 
-        traceback.print_exc()
+            traceback.print_exc()
         return 1
 
 
+@click.command()
+@click.argument("pr_urls", nargs=-1, required=True)
+@click.option(
+    "-o",
+    "--output-dir",
+    type=click.Path(path_type=Path),
+    default=Path("corpus"),
+    help="Output directory for corpus entries (default: corpus)",
+)
+@click.option(
+    "-c",
+    "--category",
+    default="uncategorized",
+    help="Category subdirectory for corpus entries (default: uncategorized)",
+)
+@click.option(
+    "--debug/--no-debug",
+    default=False,
+    help="Print a full traceback on unexpected errors (default: off)",
+)
+def main(
+    pr_urls: tuple[str, ...], output_dir: Path, category: str, debug: bool
+) -> None:
+    """Download Azure Pipeline logs from conda-forge PRs.
+
+    PR_URLS: One or more GitHub PR URLs (e.g., https://github.com/conda-forge/nomad-feedstock/pull/52)
+
+    Several PRs are processed concurrently, sharing HTTP connections.
+
+    Set GITHUB_TOKEN, or GITHUB_TOKENS to a comma-separated list of tokens, to
+    authenticate against the GitHub API and raise its rate limit.
+    """
+    max_workers = min(MAX_PARALLEL_PRS, len(pr_urls))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        exit_codes = list(
+            executor.map(
+                lambda pr_url: process_pr(pr_url, output_dir, category, debug),
+                pr_urls,
+            )
+        )
+
+    # click ignores the return value of a command, so exit explicitly
+    exit_code = max(exit_codes)
+    if exit_code == 0:
+        click.echo("\nDone!")
+    click.get_current_context().exit(exit_code)
+
+
 if __name__ == "__main__":
     sys.exit(main())
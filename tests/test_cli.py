@@ -1,12 +1,22 @@
 """Tests for the CLI module."""
 
+from pathlib import Path
+from typing import Any
+
 import pytest
+from click.testing import CliRunner
 
+from cf_error_corpus import cli
 from cf_error_corpus.cli import (
+    GitHubTokenPool,
+    download_azure_build_logs,
     extract_build_name_from_check_run_name,
     find_failed_azure_builds,
+    get_github_api_json,
+    main,
     parse_azure_details_url,
     parse_github_pr_url,
+    process_build,
 )
 
 
@@ -38,6 +48,19 @@ def test_extract_build_name_from_check_run_name() -> None:
     )
     assert extract_build_name_from_check_run_name("osx_64", "osx") == "osx_64"
     assert extract_build_name_from_check_run_name("osx-arm64", "osx") == "osx_arm64"
+    assert (
+        extract_build_name_from_check_run_name(
+            "conda-forge.nomad-feedstock (linux linux_aarch64_python3.12.____cpython)",
+            "linux",
+        )
+        == "linux_aarch64"
+    )
+    assert (
+        extract_build_name_from_check_run_name(
+            "conda-forge.nomad-feedstock (osx osx_64_python3.12.____cpython)", "osx"
+        )
+        == "osx_64"
+    )
 
 
 def test_find_failed_azure_builds() -> None:
@@ -96,6 +119,36 @@ def test_find_failed_azure_builds_only_linux() -> None:
     assert "osx" not in failed_builds
 
 
+def test_find_failed_azure_builds_keeps_first_per_arch() -> None:
+    """Test that only the first failed build per architecture is returned."""
+    check_runs: list[dict[str, Any]] = [
+        {
+            "name": "osx_arm64",
+            "conclusion": "failure",
+            "app": {"slug": "azure-pipelines"},
+        },
+        {
+            "name": "linux_64",
+            "conclusion": "failure",
+            "app": {"slug": "azure-pipelines"},
+        },
+        {
+            "name": "linux_aarch64",
+            "conclusion": "failure",
+            "app": {"slug": "azure-pipelines"},
+        },
+        {
+            "name": "osx_64",
+            "conclusion": "failure",
+        },
+    ]
+
+    failed_builds = find_failed_azure_builds(check_runs)
+
+    assert failed_builds["linux"]["name"] == "linux_64"
+    assert failed_builds["osx"]["name"] == "osx_arm64"
+
+
 def test_parse_azure_details_url() -> None:
     """Test parsing Azure Pipelines details URLs."""
     url = (
@@ -133,3 +186,161 @@ def test_parse_azure_details_url_invalid() -> None:
     assert (
         parse_azure_details_url("https://dev.azure.com/org/proj/_build/results") is None
     )
+
+
+def test_download_azure_build_logs_keeps_order(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test that concurrently downloaded logs are joined in log ID order."""
+
+    def fake_download_to_file(url: str, dest: Path, timeout: int = 30) -> int:
+        log_id = int(url.rsplit("/", 1)[1])
+        if log_id == 2:
+            raise RuntimeError("boom")
+        return dest.write_bytes(f"log {log_id}".encode())
+
+    monkeypatch.setattr(cli, "download_to_file", fake_download_to_file)
+
+    dest = tmp_path / "error.log"
+    written = download_azure_build_logs("org", "proj", "1", dest, [3, 1, 2, 4])
+    assert dest.read_text() == "log 3\nlog 1\nlog 4"
+    assert written == dest.stat().st_size
+    assert list(tmp_path.iterdir()) == [dest]
+
+
+def test_process_build_unparsable_details_url(tmp_path: Path) -> None:
+    """Test that an entry with instructions is created for unknown URLs."""
+    run_info = {"name": "linux_64", "details_url": "https://example.com/foo"}
+    pr_url = "https://github.com/conda-forge/nomad-feedstock/pull/52"
+
+    entry_dir = process_build("linux", run_info, tmp_path, "nomad", 52, pr_url)
+
+    assert entry_dir == tmp_path / "nomad-52-linux_64"
+    error_log = (entry_dir / "error.log").read_text()
+    assert "Could not parse Azure details URL" in error_log
+    assert f"source: {pr_url}" in (entry_dir / "input.yml").read_text()
+
+
+def test_process_build_no_details_url(tmp_path: Path) -> None:
+    """Test that no entry is created without a details URL."""
+    run_info = {"name": "osx_64"}
+    pr_url = "https://github.com/conda-forge/nomad-feedstock/pull/52"
+
+    assert process_build("osx", run_info, tmp_path, "nomad", 52, pr_url) is None
+    assert not any(tmp_path.iterdir())
+
+
+def test_download_azure_build_logs_skips_empty_logs(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test that empty log segments from the log list are not downloaded."""
+
+    class FakeResponse:
+        content = (
+            b'{"value": [{"id": 1, "lineCount": 10}, {"id": 2, "lineCount": 0},'
+            b' {"id": 3}]}'
+        )
+
+        def raise_for_status(self) -> None:
+            pass
+
+    downloaded: list[str] = []
+
+    def fake_download_to_file(url: str, dest: Path, timeout: int = 30) -> int:
+        downloaded.append(url)
+        return dest.write_bytes(url.rsplit("/", 1)[1].encode())
+
+    monkeypatch.setattr(cli._SESSION, "get", lambda url, timeout: FakeResponse())
+    monkeypatch.setattr(cli, "download_to_file", fake_download_to_file)
+
+    dest = tmp_path / "error.log"
+    assert download_azure_build_logs("org", "proj", "1", dest) == 3
+    assert dest.read_text() == "1\n3"
+    assert len(downloaded) == 2
+
+
+def test_get_github_api_json_uses_etag_cache(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test that a 304 response is served from the on-disk cache."""
+
+    class FakeResponse:
+        def __init__(self, status_code: int, content: bytes) -> None:
+            self.status_code = status_code
+            self.content = content
+            self.headers = {"ETag": '"abc"'} if status_code == 200 else {}
+
+        def raise_for_status(self) -> None:
+            pass
+
+    requests_headers: list[dict[str, str]] = []
+
+    def fake_get(url: str, headers: dict[str, str], timeout: int) -> FakeResponse:
+        requests_headers.append(headers)
+        if headers.get("If-None-Match") == '"abc"':
+            return FakeResponse(304, b"")
+        return FakeResponse(200, b'{"head": {"sha": "123"}}')
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setattr(cli._SESSION, "get", fake_get)
+
+    url = "https://api.github.com/repos/conda-forge/nomad-feedstock/pulls/52"
+    assert get_github_api_json(url) == {"head": {"sha": "123"}}
+    assert "If-None-Match" not in requests_headers[0]
+
+    assert get_github_api_json(url) == {"head": {"sha": "123"}}
+    assert requests_headers[1]["If-None-Match"] == '"abc"'
+
+
+def test_github_token_pool_round_robin() -> None:
+    """Test that tokens are handed out in turn, skipping exhausted ones."""
+    pool = GitHubTokenPool(["a", "b", "c"])
+    assert [pool.get() for _ in range(4)] == ["a", "b", "c", "a"]
+
+    pool.update("c", {"X-RateLimit-Remaining": "3"})
+    assert [pool.get() for _ in range(3)] == ["b", "a", "b"]
+
+    pool.update("a", {"X-RateLimit-Remaining": "0"})
+    pool.update("b", {"X-RateLimit-Remaining": "5"})
+    assert pool.get() == "b"
+
+
+def test_github_token_pool_from_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test reading tokens from the environment."""
+    monkeypatch.delenv("GITHUB_TOKENS", raising=False)
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    assert GitHubTokenPool.from_env().get() is None
+
+    monkeypatch.setenv("GITHUB_TOKEN", "single")
+    assert GitHubTokenPool.from_env().get() == "single"
+
+    monkeypatch.setenv("GITHUB_TOKENS", "one, two")
+    pool = GitHubTokenPool.from_env()
+    assert [pool.get(), pool.get()] == ["one", "two"]
+
+
+def test_main_traceback_only_with_debug() -> None:
+    """Test that a traceback is only printed with --debug."""
+    runner = CliRunner()
+
+    result = runner.invoke(main, ["not a url"])
+    assert "Error: Invalid GitHub PR URL" in result.output
+    assert "Traceback" not in result.output
+
+    result = runner.invoke(main, ["not a url", "--debug"])
+    assert "Error: Invalid GitHub PR URL" in result.output
+    assert "Traceback" in result.output
+
+
+def test_main_requires_pr_url() -> None:
+    """Test that at least one PR URL has to be passed."""
+    result = CliRunner().invoke(main, [])
+    assert result.exit_code != 0
+    assert "Missing argument" in result.output
+
+
+def test_main_exit_code_on_failure() -> None:
+    """Test that a failing PR results in a non-zero exit code."""
+    result = CliRunner().invoke(main, ["not a url"])
+    assert result.exit_code == 1
+    assert "Done!" not in result.output
@@ -5,7 +5,13 @@ from tempfile import TemporaryDirectory
 
 import pytest
 
-from cf_error_corpus.validate import InputYaml, main, validate_input_yml
+from cf_error_corpus import validate
+from cf_error_corpus.validate import (
+    InputYaml,
+    find_input_ymls,
+    main,
+    validate_input_yml,
+)
 
 
 def test_input_yaml_schema_valid():
@@ -77,6 +83,36 @@ expected_output: |
         assert "source" in error_msg.lower() or "url" in error_msg.lower()
 
 
+def test_validate_input_yml_non_standard_layout():
+    """Test files that do not match the layout written by the download CLI."""
+    with TemporaryDirectory() as tmpdir:
+        test_file = Path(tmpdir) / "input.yml"
+        # Blank line in a literal block and quoted source are valid YAML
+        test_file.write_text("""source: "https://github.com/conda-forge/test/pull/1"
+input: error.log
+most_minimal_output: |
+  error: test
+
+  more details
+expected_output: |
+  full error output
+""")
+        assert validate_input_yml(test_file) == (True, "")
+
+        # The first line of a literal block determines its indentation
+        test_file.write_text("""source: https://github.com/conda-forge/test/pull/1
+input: error.log
+most_minimal_output: |
+   error: test
+  more details
+expected_output: |
+  full error output
+""")
+        is_valid, error_msg = validate_input_yml(test_file)
+        assert not is_valid
+        assert "Error reading file" in error_msg
+
+
 def test_validate_input_yml_missing_file():
     """Test validation of a missing file."""
     is_valid, error_msg = validate_input_yml(Path("/nonexistent/input.yml"))
@@ -84,9 +120,32 @@ def test_validate_input_yml_missing_file():
     assert "Error reading file" in error_msg
 
 
+def test_find_input_ymls():
+    """Test that input.yml files are found in nested directories."""
+    with TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        (root / "cat" / "entry").mkdir(parents=True)
+        (root / "cat" / "entry" / "input.yml").touch()
+        (root / "cat" / "entry" / "error.log").touch()
+        (root / "input.yml").touch()
+        (root / "empty").mkdir()
+
+        found = sorted(find_input_ymls(tmpdir))
+        assert found == sorted(
+            [str(root / "input.yml"), str(root / "cat" / "entry" / "input.yml")]
+        )
+
+
 def test_main_with_valid_files():
     """Test main function with valid corpus files."""
     # This will test against actual corpus files if they exist
     exit_code = main()
     # Should succeed (0) or fail (1) depending on corpus files
     assert exit_code in (0, 1)
+
+
+def test_main_parallel(monkeypatch):
+    """Test that validating in worker processes gives the same result."""
+    serial_exit_code = main()
+    monkeypatch.setattr(validate, "PARALLEL_VALIDATION_THRESHOLD", 0)
+    assert main() == serial_exit_code